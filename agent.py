@@ -1,16 +1,31 @@
 import os
 import json
 import asyncio
+import threading
 import time
 import urllib.parse
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from os import stat as _stat
+from time import time as _now
+from typing import Any, Dict, List, Optional, Tuple
 import requests
+from requests.adapters import HTTPAdapter
 import jwt  
+import anyio
+import httpx
 import boto3
 from botocore.config import Config
 from fastmcp import Client as MCPClient
+from fastmcp.client.transports import StreamableHttpTransport
+from mcp.shared.exceptions import McpError
+from mcp.types import CONNECTION_CLOSED
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to stdlib json
+    orjson = None
+
 RESET  = "\033[0m"
 BOLD   = "\033[1m"
 WHITE  = "\033[97m"
@@ -36,22 +51,65 @@ OIDC_CLIENT_SECRET = os.getenv("OIDC_CLIENT_SECRET", "")
 OIDC_SCOPE = os.getenv("OIDC_SCOPE", "email openid profile")
 OIDC_REDIRECT_URI = os.getenv("OIDC_REDIRECT_URI", "")
 
+AUTH_URL = f"{COGNITO_DOMAIN}/oauth2/authorize?" + urllib.parse.urlencode({
+    "response_type": "code",
+    "client_id": OIDC_CLIENT_ID,
+    "redirect_uri": OIDC_REDIRECT_URI,
+    "scope": OIDC_SCOPE,
+})
+
+AGENT_REGION = "eu-west-1"
+MCP_SOURCE = (
+    f"https://bedrock-agentcore.{AGENT_REGION}.amazonaws.com/runtimes/"
+    f"{urllib.parse.quote(os.getenv('AGENT_ARN', ''), safe='')}/invocations?qualifier=DEFAULT"
+)
+
 TOKEN_CACHE_PATH = os.path.expanduser("~/.drive_mcp_oidc_token.json")
 
+MCP_CALL_TIMEOUT = 30.0
 
-def _load_cached_token() -> Optional[dict]:
-    """Return cached token if present and not expired, else None."""
-    if not os.path.exists(TOKEN_CACHE_PATH):
-        return None
+# Shared session so token endpoint calls reuse pooled connections
+_HTTP = requests.Session()
+_HTTP.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
+
+def _json_load_bytes(raw: bytes) -> Any:
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+
+def _json_dump_bytes(obj: Any) -> bytes:
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
 
+
+@lru_cache(maxsize=1)
+def _read_token_cache_at(mtime_ns: int, size: int) -> Optional[dict]:
+    """Parse the token cache file, memoized on its modification time and size."""
     try:
-        with open(TOKEN_CACHE_PATH, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(TOKEN_CACHE_PATH, "rb") as f:
+            return _json_load_bytes(f.read())
     except Exception:
         return None
 
+
+def _read_token_cache() -> Optional[dict]:
+    """Return the cached token as stored on disk, expired or not."""
+    try:
+        st = _stat(TOKEN_CACHE_PATH)
+    except OSError:
+        return None
+    return _read_token_cache_at(st.st_mtime_ns, st.st_size)
+
+
+def _load_cached_token() -> Optional[dict]:
+    """Return cached token if present and not expired, else None."""
+    data = _read_token_cache()
+    if data is None:
+        return None
+
     expires_at = data.get("expires_at", 0)
-    if time.time() < expires_at - 60:
+    if _now() < expires_at - 60:
         return data
     return None
 
@@ -61,8 +119,10 @@ def _save_cached_token(tok: dict) -> None:
     expires_in = tok.get("expires_in", 3600)
     tok["expires_at"] = time.time() + expires_in
     os.makedirs(os.path.dirname(TOKEN_CACHE_PATH), exist_ok=True)
-    with open(TOKEN_CACHE_PATH, "w", encoding="utf-8") as f:
-        json.dump(tok, f, indent=2)
+    with open(TOKEN_CACHE_PATH, "wb") as f:
+        f.write(_json_dump_bytes(tok))
+    # Coarse filesystem timestamps can leave mtime unchanged across a rewrite
+    _read_token_cache_at.cache_clear()
     log("✔", f"Token cached at {TOKEN_CACHE_PATH}", GREEN)
 
 
@@ -73,20 +133,12 @@ def _interactive_oidc_login() -> dict:
             "OIDC_CLIENT_ID, OIDC_CLIENT_SECRET and OIDC_REDIRECT_URI are set."
         )
 
-    params = {
-        "response_type": "code",
-        "client_id": OIDC_CLIENT_ID,
-        "redirect_uri": OIDC_REDIRECT_URI,
-        "scope": OIDC_SCOPE,
-    }
-    auth_url = f"{COGNITO_DOMAIN}/oauth2/authorize?{urllib.parse.urlencode(params)}"
-
     print()
     print(f"{YELLOW}▲ OIDC login required{RESET}")
     print("Open this URL in your browser, log in,")
     print("then copy the FULL redirect URL from the address bar and paste it here:")
     print()
-    print(f"{CYAN}{auth_url}{RESET}")
+    print(f"{CYAN}{AUTH_URL}{RESET}")
     print()
 
     redirect_url = input(f"{BOLD}{MAGENTA}Paste redirect URL ▶ {RESET}").strip()
@@ -96,7 +148,7 @@ def _interactive_oidc_login() -> dict:
     if not code:
         raise RuntimeError("No 'code' query parameter found in the redirect URL.")
 
-    token_resp = requests.post(
+    token_resp = _HTTP.post(
         f"{COGNITO_DOMAIN}/oauth2/token",
         data={
             "grant_type": "authorization_code",
@@ -115,44 +167,159 @@ def _interactive_oidc_login() -> dict:
     return tok
 
 
+def _refresh_token(refresh_token: str) -> dict:
+    """Exchange a refresh token for a new access token."""
+    token_resp = _HTTP.post(
+        f"{COGNITO_DOMAIN}/oauth2/token",
+        data={
+            "grant_type": "refresh_token",
+            "client_id": OIDC_CLIENT_ID,
+            "client_secret": OIDC_CLIENT_SECRET,
+            "refresh_token": refresh_token,
+        },
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+        timeout=15,
+    )
+    token_resp.raise_for_status()
+    tok = token_resp.json()
+    # Cognito doesn't rotate refresh tokens, keep the one we have
+    tok.setdefault("refresh_token", refresh_token)
+    _save_cached_token(tok)
+    log("✔", "OIDC token refreshed", GREEN)
+    return tok
+
+
 def get_user_jwt() -> str:
     """
     Return a user JWT (id_token) for calling the MCP runtime.
-    Uses cache if valid, otherwise runs interactive login.
+    Uses cache if valid, then the cached refresh token, otherwise runs interactive login.
     """
     cached = _load_cached_token()
     if cached:
         return cached["access_token"]
 
+    stale = _read_token_cache()
+    if stale and stale.get("refresh_token"):
+        try:
+            return _refresh_token(stale["refresh_token"])["access_token"]
+        except Exception as e:
+            log("⚠", f"Token refresh failed, logging in again: {e}", YELLOW)
+
     tok = _interactive_oidc_login()
     return tok["access_token"]
 
 
+# Session loss worth reconnecting for; anything else is surfaced to the model as a tool error.
+# A dropped session fails pending calls with McpError(CONNECTION_CLOSED) and new sends
+# with anyio stream errors. A per-call timeout (McpError(REQUEST_TIMEOUT)) or a read
+# error is not retried: the session may be fine and the server may still be running
+# the call, so resending it could repeat side effects like copying a template.
+_RETRYABLE_ERRORS = (
+    ConnectionError,
+    httpx.ConnectError,
+    httpx.ConnectTimeout,
+    anyio.ClosedResourceError,
+    anyio.BrokenResourceError,
+)
+# 32600 is what the streamable HTTP transport reports when the server dropped our session
+_RETRYABLE_MCP_CODES = {CONNECTION_CLOSED, 32600}
+
+
+def _is_retryable(e: BaseException) -> bool:
+    if isinstance(e, McpError):
+        return e.error.code in _RETRYABLE_MCP_CODES
+    if isinstance(e, _RETRYABLE_ERRORS):
+        return True
+    # fastmcp wraps connect failures in RuntimeError("Client failed to connect: ...")
+    return isinstance(e, RuntimeError) and e.__cause__ is not None and _is_retryable(e.__cause__)
+
+
+def _mcp_httpx_client(
+    headers: Optional[Dict[str, str]] = None,
+    timeout: Optional[httpx.Timeout] = None,
+    auth: Optional[httpx.Auth] = None,
+) -> httpx.AsyncClient:
+    """httpx client for the MCP transport with a short connect timeout and kept-alive connections."""
+    # Keep the transport's long read timeout, streamed responses can stay open between events
+    read_timeout = timeout.read if timeout else None
+    return httpx.AsyncClient(
+        headers=headers,
+        auth=auth,
+        timeout=httpx.Timeout(MCP_CALL_TIMEOUT, connect=5.0, read=read_timeout),
+        limits=httpx.Limits(max_keepalive_connections=8, keepalive_expiry=60.0),
+        follow_redirects=True,
+    )
+
+
 def _json_objectize(value: Any) -> Dict[str, Any]:
     if isinstance(value, dict):
         return value
     if isinstance(value, list):
         return {"items": value}
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return {"result": value}
     try:
+        # Probe with stdlib json, that's what botocore uses to send the result
         json.dumps(value)
         return {"result": value}
     except TypeError:
         return {"result": str(value)}
 
 
+def _parse_tool_args(tool_use: Dict[str, Any]) -> Dict[str, Any]:
+    args = tool_use.get("input")
+    if isinstance(args, str):
+        return json.loads(args)
+    if args is None:
+        return {}
+    return args
+
+
+class _ToolEntry:
+    __slots__ = ("name", "description", "input_schema", "original_name")
+
+    def __init__(self, name: str, description: str, input_schema: Optional[Dict[str, Any]], original_name: str):
+        self.name = name
+        self.description = description
+        self.input_schema = input_schema
+        self.original_name = original_name
+
+
 class MCPToolCatalog:
-    def __init__(self, mcp_source: Any, auth: Optional[str] = None, prefix: Optional[str] = None):
+    def __init__(
+        self,
+        mcp_source: Any,
+        auth: Optional[str] = None,
+        prefix: Optional[str] = None,
+        keepalive_interval: float = 25.0,
+        backoff_base: float = 0.5,
+        max_retries: int = 3,
+    ):
         self._src = mcp_source
         self._prefix = prefix or ""
-        self._tools: Dict[str, Dict[str, Any]] = {}
+        self._tools: Dict[str, _ToolEntry] = {}
         self._active = False
         self._client: Optional[MCPClient] = None
         self._ctx_client = None
         self._auth = auth
+        self._keepalive_interval = keepalive_interval
+        self._backoff_base = backoff_base
+        self._max_retries = max_retries
+        self._keepalive_task: Optional[asyncio.Task] = None
+        self._refresh_lock = asyncio.Lock()
+        self._bedrock_tool_config: Dict[str, Any] = {"tools": []}
 
     def _new_client(self):
             if self._auth:
                 print(f"{GRAY}[{_ts()}]{RESET} {WHITE}Using authenticated MCP client with token {self._auth[:20]}...{RESET}")
+            if isinstance(self._src, str) and self._src.startswith(("http://", "https://")):
+                transport = StreamableHttpTransport(
+                    url=self._src,
+                    auth=self._auth,
+                    httpx_client_factory=_mcp_httpx_client,
+                )
+                return MCPClient(transport, timeout=MCP_CALL_TIMEOUT)
+            if self._auth:
                 return MCPClient(self._src, auth=self._auth)
             return MCPClient(self._src)
     
@@ -165,41 +332,64 @@ class MCPToolCatalog:
         await self._ctx_client.ping()
         tools = await self._ctx_client.list_tools()
         self._tools = {
-            t.name: {
-                "name": t.name,
-                "description": getattr(t, "description", "") or "",
-                "inputSchema": getattr(t, "inputSchema", None),
-                "original_name": t.name,
-            }
+            t.name: _ToolEntry(
+                name=t.name,
+                description=getattr(t, "description", "") or "",
+                input_schema=getattr(t, "inputSchema", None),
+                original_name=t.name,
+            )
             for t in tools
         }
+        self._bedrock_tool_config = {
+            "tools": [
+                {
+                    "toolSpec": {
+                        "name": t.name,
+                        "description": t.description,
+                        "inputSchema": {"json": t.input_schema or {"type": "object", "properties": {}}},
+                    }
+                }
+                for t in self._tools.values()
+            ]
+        }
         log("✔", f"Loaded {len(tools)} tools", GREEN)
+        self._keepalive_task = asyncio.create_task(self._keepalive())
         return self
 
     async def __aexit__(self, exc_type, exc, tb):
         self._active = False
+        if self._keepalive_task is not None:
+            self._keepalive_task.cancel()
+            try:
+                await self._keepalive_task
+            except asyncio.CancelledError:
+                pass
         if self._client is not None:
             await self._client.__aexit__(exc_type, exc, tb)
         log("■", "MCP session closed", CYAN)
 
     def bedrock_tool_config(self) -> Dict[str, Any]:
-        specs = []
-        for t in self._tools.values():
-            schema = t["inputSchema"] or {"type": "object", "properties": {}}
-            specs.append({
-                "toolSpec": {
-                    "name": t["name"],
-                    "description": t["description"],
-                    "inputSchema": {"json": schema},
-                }
-            })
-        return {"tools": specs}
-
-    async def _refresh_client(self):
-        log("↺", "Refreshing MCP client...", YELLOW)
-        await self._client.__aexit__(None, None, None)
-        self._client = self._new_client()
-        self._ctx_client = await self._client.__aenter__()
+        """Return the Bedrock toolConfig built when the session was opened."""
+        return self._bedrock_tool_config
+
+    async def _keepalive(self):
+        """Ping the server while idle so the session isn't dropped between turns."""
+        while self._active:
+            await asyncio.sleep(self._keepalive_interval)
+            try:
+                await self._ctx_client.ping()
+            except Exception as e:
+                log("⚠", f"Keepalive ping failed: {e}", YELLOW)
+
+    async def _refresh_client(self, stale=None):
+        async with self._refresh_lock:
+            # Concurrent tool calls may fail together, only the first one reconnects
+            if stale is not None and self._ctx_client is not stale:
+                return
+            log("↺", "Refreshing MCP client...", YELLOW)
+            await self._client.__aexit__(None, None, None)
+            self._client = self._new_client()
+            self._ctx_client = await self._client.__aenter__()
 
     async def call(self, tool_name: str, arguments: Dict[str, Any]) -> Any:
         ts = _ts()
@@ -211,13 +401,27 @@ class MCPToolCatalog:
         entry = self._tools.get(tool_name)
         if not entry:
             raise ValueError(f"Unknown MCP tool: {tool_name}")
+        ctx = self._ctx_client
         try:
-            res = await self._ctx_client.call_tool(entry["original_name"], arguments or {})
+            res = await ctx.call_tool(entry.original_name, arguments or {})
             print(f"{GRAY}[{_ts()}]{RESET} {GREEN}✔ Call succeeded{RESET} Result {res}")
         except Exception as e:
-            print(f"{GRAY}[{_ts()}]{RESET} {YELLOW}⚠ Tool call failed, retrying... ({e}){RESET}")
-            await self._refresh_client()
-            res = await self._ctx_client.call_tool(entry["original_name"], arguments or {})
+            if not _is_retryable(e):
+                raise
+            for attempt in range(self._max_retries):
+                print(f"{GRAY}[{_ts()}]{RESET} {YELLOW}⚠ Tool call failed, retrying... ({e}){RESET}")
+                await asyncio.sleep(self._backoff_base * 2 ** attempt)
+                try:
+                    await self._refresh_client(ctx)
+                    ctx = self._ctx_client
+                    res = await ctx.call_tool(entry.original_name, arguments or {})
+                    break
+                except Exception as retry_error:
+                    if not _is_retryable(retry_error):
+                        raise
+                    e = retry_error
+            else:
+                raise e
             print(f"{GRAY}[{_ts()}]{RESET} {GREEN}✔ Call succeeded after refresh{RESET}")
 
         if getattr(res, "data", None) is not None:
@@ -251,28 +455,111 @@ class BedrockMCPAgent:
         self.system_prompt = system_prompt or "You are a helpful assistant that uses tools when helpful."
         log("✔", "Bedrock ready", GREEN)
 
-    def _invoke(self) -> Dict[str, Any]:
+    def _start_stream(self) -> Dict[str, Any]:
+        kwargs = {
+            "modelId": self.model_id,
+            "messages": self.messages,
+            "system": [{"text": self.system_prompt}],
+            "toolConfig": self.tool_config,
+        }
         try:
-            return self.client.converse(
-                modelId=self.model_id,
-                messages=self.messages,
-                system=[{"text": self.system_prompt}],
-                toolConfig=self.tool_config,
-            )
+            return self.client.converse_stream(**kwargs)
         except Exception as e:
             log("⚠", f"Throttled by Bedrock service: {e}", YELLOW)
             time.sleep(2)
-            return self.client.converse(
-                modelId=self.model_id,
-                messages=self.messages,
-                system=[{"text": self.system_prompt}],
-                toolConfig=self.tool_config,
-            )
+            return self.client.converse_stream(**kwargs)
+
+    def _pump_stream(self, loop: asyncio.AbstractEventLoop, queue: asyncio.Queue, stop: threading.Event) -> None:
+        """Drive the blocking event stream on a worker thread, feeding events to the loop."""
+        stream = None
+        try:
+            stream = self._start_stream()["stream"]
+            for event in stream:
+                if stop.is_set():
+                    break
+                loop.call_soon_threadsafe(queue.put_nowait, event)
+        except Exception as e:
+            loop.call_soon_threadsafe(queue.put_nowait, e)
+        finally:
+            # Release the HTTP response back to the pool, even if we stopped reading early
+            if stream is not None:
+                stream.close()
+            loop.call_soon_threadsafe(queue.put_nowait, None)
+
+    async def _invoke(self, dispatch_tools: bool = True) -> Tuple[Dict[str, Any], Dict[str, asyncio.Task]]:
+        """
+        Stream a Converse response and rebuild it in the shape converse() returns.
+        Each tool use is dispatched as soon as its input is complete, the running
+        tasks are returned keyed by toolUseId.
+        """
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        stop = threading.Event()
+        producer = loop.run_in_executor(None, self._pump_stream, loop, queue, stop)
+
+        texts: Dict[int, List[str]] = {}
+        tool_uses: Dict[int, Dict[str, Any]] = {}
+        tool_inputs: Dict[int, List[str]] = {}
+        tool_tasks: Dict[str, asyncio.Task] = {}
+        stop_reason = None
+
+        try:
+            while (event := await queue.get()) is not None:
+                if isinstance(event, Exception):
+                    raise event
+
+                if "contentBlockStart" in event:
+                    block = event["contentBlockStart"]
+                    tu = block["start"].get("toolUse")
+                    if tu:
+                        idx = block["contentBlockIndex"]
+                        tool_uses[idx] = {"toolUseId": tu["toolUseId"], "name": tu["name"], "input": {}}
+                        tool_inputs[idx] = []
+                elif "contentBlockDelta" in event:
+                    block = event["contentBlockDelta"]
+                    idx = block["contentBlockIndex"]
+                    delta = block["delta"]
+                    if "text" in delta:
+                        texts.setdefault(idx, []).append(delta["text"])
+                    elif "toolUse" in delta:
+                        tool_inputs[idx].append(delta["toolUse"].get("input", ""))
+                elif "contentBlockStop" in event:
+                    idx = event["contentBlockStop"]["contentBlockIndex"]
+                    if idx in tool_uses:
+                        tu = tool_uses[idx]
+                        raw = "".join(tool_inputs[idx])
+                        tu["input"] = json.loads(raw) if raw else {}
+                        if dispatch_tools:
+                            tool_tasks[tu["toolUseId"]] = asyncio.create_task(self.mcp.call(tu["name"], tu["input"]))
+                elif "messageStop" in event:
+                    stop_reason = event["messageStop"].get("stopReason")
+        except BaseException:
+            # Abandon this response (error or cancellation): stop reading the stream
+            # and cancel tools already started
+            stop.set()
+            for task in tool_tasks.values():
+                task.cancel()
+            raise
+
+        await producer
+
+        content = []
+        for idx in sorted(texts.keys() | tool_uses.keys()):
+            if idx in tool_uses:
+                content.append({"toolUse": tool_uses[idx]})
+            else:
+                content.append({"text": "".join(texts[idx])})
+
+        response = {
+            "output": {"message": {"role": "assistant", "content": content}},
+            "stopReason": stop_reason,
+        }
+        return response, tool_tasks
 
     async def chat(self, user_text: str) -> str:
         start = time.time()
         self.messages.append({"role": "user", "content": [{"text": user_text}]})
-        response = self._invoke()
+        response, tool_tasks = await self._invoke(dispatch_tools=self.max_tool_rounds > 0)
         self.messages.append(response["output"]["message"])
 
         rounds = 0
@@ -288,23 +575,31 @@ class BedrockMCPAgent:
             if not tool_uses:
                 break
 
-            tool_result_blocks = []
-
-            for tu in tool_uses:
-                name = tu["name"]
-                args = tu.get("input")
-                if isinstance(args, str):
-                    args = json.loads(args)
-                elif args is None:
-                    args = {}
+            # Tool uses within a round are independent and already running from the stream
+            results = await asyncio.gather(
+                *(
+                    tool_tasks.get(tu["toolUseId"]) or self.mcp.call(tu["name"], _parse_tool_args(tu))
+                    for tu in tool_uses
+                ),
+                return_exceptions=True,
+            )
 
-                raw = await self.mcp.call(name, args)
-                obj = _json_objectize(raw)
+            tool_result_blocks = []
+            for tu, raw in zip(tool_uses, results):
+                if isinstance(raw, Exception):
+                    tool_result_blocks.append({
+                        "toolResult": {
+                            "toolUseId": tu["toolUseId"],
+                            "status": "error",
+                            "content": [{"text": str(raw)}],
+                        }
+                    })
+                    continue
 
                 tool_result_blocks.append({
                     "toolResult": {
                         "toolUseId": tu["toolUseId"],
-                        "content": [{"json": obj}],
+                        "content": [{"json": _json_objectize(raw)}],
                     }
                 })
 
@@ -313,9 +608,14 @@ class BedrockMCPAgent:
                 "content": tool_result_blocks,
             })
 
-            response = self._invoke()
+            response, tool_tasks = await self._invoke(dispatch_tools=rounds < self.max_tool_rounds)
             self.messages.append(response["output"]["message"])
 
+        # Tool calls the loop won't consume (e.g. stopped for max_tokens) are abandoned
+        if response.get("stopReason") != "tool_use":
+            for task in tool_tasks.values():
+                task.cancel()
+
         blocks = self.messages[-1]["content"]
         texts = [b.get("text", "") for b in blocks if "text" in b]
         result = "\n".join(t for t in texts if t)
@@ -323,7 +623,7 @@ class BedrockMCPAgent:
         return result
 
 
-async def main():
+async def main(mcp_source: str = MCP_SOURCE):
     log("▶", "Starting Bedrock MCP Agent", CYAN)
 
     model_id = os.getenv(
@@ -331,10 +631,6 @@ async def main():
         "arn:aws:bedrock:eu-west-1:519689943567:inference-profile/eu.anthropic.claude-3-haiku-20240307-v1:0",
     )
 
-    arn = os.getenv("AGENT_ARN", "")
-    encoded = urllib.parse.quote(arn, safe='')
-    region = "eu-west-1"
-    mcp_source = f"https://bedrock-agentcore.{region}.amazonaws.com/runtimes/{encoded}/invocations?qualifier=DEFAULT"
     system = """
     You are a helpful AI assistant that can use various tools to assist the user.
     """
@@ -344,7 +640,8 @@ async def main():
     async with MCPToolCatalog(mcp_source=mcp_source, auth=user_jwt) as catalog:
         agent = BedrockMCPAgent(model_id=model_id, mcp_catalog=catalog, system_prompt=system)
         while True:
-            user_input = input(f"{BOLD}{MAGENTA}You ▶ {RESET}")
+            # Read in a thread so the keepalive can keep pinging while the user types
+            user_input = await asyncio.to_thread(input, f"{BOLD}{MAGENTA}You ▶ {RESET}")
             if user_input.lower() in {"exit", "quit"}:
                 log("■", "Session ended", CYAN)
                 break
@@ -352,5 +649,5 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    asyncio.run(main(MCP_SOURCE))
 
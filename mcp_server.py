@@ -1,12 +1,22 @@
+import asyncio
 import logging
 import re
+import threading
+from functools import lru_cache
 from mcp.server.fastmcp import FastMCP
 from google.oauth2.credentials import Credentials
+from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.discovery import build
+from googleapiclient.http import build_http
 
 from toolset import Toolset, tool
 from workload import Workload
 
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to walking the document
+    orjson = None
+
 instructions = """
     Tools that you have help you fill in templates bu you must first authenticate the user
     To Replace a template you should follow these steps:
@@ -22,6 +32,74 @@ mcp = FastMCP(host="0.0.0.0", port=8000, stateless_http=True, instructions=instr
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
+_VAR_RE = re.compile(r"\{\{([^}\n]+)\}\}")
+# Fields mask for reading templates, only the text runs are needed to find placeholders
+_TEMPLATE_TEXT_FIELDS = "body(content(paragraph(elements(textRun(content)))))"
+# Same pattern over serialized JSON, a match can't leave its string
+_VAR_BYTES_RE = re.compile(rb'\{\{([^}"\\]+)\}\}')
+# A brace next to a string boundary means a placeholder may span text runs.
+# These patterns only hold for documents fetched with _TEMPLATE_TEXT_FIELDS and
+# serialized by orjson without indentation: every string is then a textRun
+# "content" value, directly preceded by ':' and followed by the closing '}' of
+# its textRun. Widening the mask (e.g. textRun(content,textStyle)) breaks that
+# and split placeholders would be silently missed, so update both together.
+_RUN_EDGE_BRACES = (b':"{', b':"}', b'{"}', b'}"}')
+_SHORT_DOC_ELEMENTS = 200
+
+# httplib2 isn't thread-safe, each worker thread keeps its own connection pool
+_thread_local = threading.local()
+
+
+@lru_cache(maxsize=256)
+def _get_service(api: str, version: str, token: str):
+    """Build a Google API client once per (api, version, access token)."""
+    creds = Credentials(token=token)
+    return build(api, version, credentials=creds, cache_discovery=False, static_discovery=True)
+
+
+def _thread_http():
+    http = getattr(_thread_local, "http", None)
+    if http is None:
+        http = _thread_local.http = build_http()
+    return http
+
+
+def _execute_in_thread(req):
+    return req.execute(http=AuthorizedHttp(req.http.credentials, http=_thread_http()))
+
+
+async def _execute(req):
+    """Run a googleapiclient request on a worker thread so it doesn't block the event loop."""
+    return await asyncio.to_thread(_execute_in_thread, req)
+
+
+def _scan_placeholders(doc) -> set | None:
+    """
+    Find placeholders with one regex pass over a document fetched with _TEMPLATE_TEXT_FIELDS.
+    Returns None when a placeholder may be split across runs and the document must be walked.
+    """
+    if orjson is None:
+        return None
+
+    data = orjson.dumps(doc)
+    found = _VAR_BYTES_RE.findall(data)
+    if len(found) != data.count(b"{{") or any(edge in data for edge in _RUN_EDGE_BRACES):
+        return None
+    return {m.decode("utf-8") for m in found}
+
+
+def _fragments(content):
+    """Yield the text of every textRun in a Docs body, in document order."""
+    for element in content:
+        para = element.get("paragraph")
+        if not para:
+            continue
+
+        for elem in para.get("elements", []):
+            run = elem.get("textRun")
+            if run and "content" in run:
+                yield run["content"]
+
 
 class DriveToolset(Toolset):
     def __init__(self):
@@ -64,14 +142,11 @@ class DriveToolset(Toolset):
                 "message": "Failed to obtain access token. Please authorize again.",
             }
 
-        creds = Credentials(token=access_token)
         try:
-            service = build("drive", "v3", credentials=creds)
-            results = (
-            service.files()
-            .list(pageSize=10, q=query, fields="nextPageToken, files(id, name)")
-            .execute()
-        )
+            service = _get_service("drive", "v3", access_token)
+            results = await _execute(
+                service.files().list(pageSize=10, q=query, fields="nextPageToken, files(id, name)")
+            )
             return {
                 "type": "success",
                 "files": results.get("files", []),
@@ -84,22 +159,24 @@ class DriveToolset(Toolset):
 
     def _extract_text(self, doc) -> set:
         content = doc.get("body", {}).get("content", [])
-        text_fragments = []
+        placeholders = set()
+        tail = ""
 
-        for element in content:
-            para = element.get("paragraph")
-            if not para:
-                continue
+        # Find {{VARIABLE}} patterns run by run instead of joining the whole document
+        fragments = _fragments(content)
+        for frag in fragments:
+            text = tail + frag if tail else frag
+            placeholders.update(_VAR_RE.findall(text))
 
-            for elem in para.get("elements", []):
-                run = elem.get("textRun")
-                if run and "content" in run:
-                    text_fragments.append(run["content"])
+            # A pending match can't span a "}", except a trailing one awaiting its pair.
+            open_at = text.find("{{", text.rfind("}", 0, len(text) - 1) + 1)
+            if open_at != -1:
+                # An unclosed "{{" may be completed by a later run, finish the rest in one pass
+                placeholders.update(_VAR_RE.findall("".join([text[open_at:], *fragments])))
+                break
 
-        full_text = "".join(text_fragments)
+            tail = "{" if text.endswith("{") else ""
 
-    # Find {{VARIABLE}} patterns using regex
-        placeholders = set(re.findall(r"\{\{(.*?)\}\}", full_text))
         return placeholders
 
 
@@ -115,12 +192,20 @@ class DriveToolset(Toolset):
             return access_token
 
 
-        creds = Credentials(token=access_token)
-        docs = build("docs", "v1", credentials=creds)
+        docs = _get_service("docs", "v1", access_token)
 
         try:
-            doc = docs.documents().get(documentId=file_id).execute()
-            variables = self._extract_text(doc)
+            doc = await _execute(
+                docs.documents().get(
+                    documentId=file_id,
+                    fields=_TEMPLATE_TEXT_FIELDS,
+                )
+            )
+            variables = None
+            if len(doc.get("body", {}).get("content", [])) <= _SHORT_DOC_ELEMENTS:
+                variables = _scan_placeholders(doc)
+            if variables is None:
+                variables = self._extract_text(doc)
             return {
                 "type": "success",
                     "variables": list(variables),
@@ -155,33 +240,30 @@ class DriveToolset(Toolset):
         if isinstance(access_token, dict):
             return access_token
 
-        creds = Credentials(token=access_token)
-        drive = build("drive", "v3", credentials=creds)
-        docs = build("docs", "v1", credentials=creds)
-        new_file = drive.files().copy(
-            fileId=file_id,
-            body={"name": completed_file_name}
-        ).execute()
+        drive = _get_service("drive", "v3", access_token)
+
+        # Copy the template while the docs client is built
+        new_file, docs = await asyncio.gather(
+            _execute(drive.files().copy(fileId=file_id, body={"name": completed_file_name})),
+            asyncio.to_thread(_get_service, "docs", "v1", access_token),
+        )
 
         doc_id = new_file["id"]
 
-        requests = []
-        for var, value in variables.items():
-            requests.append({
+        requests = [
+            {
                 "replaceAllText": {
-                    "containsText": {
-                        "text": f"{{{{{var}}}}}",
-                        "matchCase": True
-                    },
-                    "replaceText": value
+                    "containsText": {"text": f"{{{{{var}}}}}", "matchCase": True},
+                    "replaceText": value,
                 }
-            })
+            }
+            for var, value in variables.items()
+        ]
 
         try:
-            result = docs.documents().batchUpdate(
-                documentId=doc_id,
-                body={"requests": requests}
-            ).execute()
+            result = await _execute(
+                docs.documents().batchUpdate(documentId=doc_id, body={"requests": requests})
+            )
 
             return {
                 "type": "success",
@@ -1,11 +1,24 @@
-import inspect
-
 from mcp.server.fastmcp import FastMCP
 
+
+class _Tool:
+    """Descriptor that records a decorated method's name on its owning class."""
+    def __init__(self, func):
+        self.func = func
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner, name):
+        if "_tool_names" not in owner.__dict__:
+            owner._tool_names = []
+        owner._tool_names.append(name)
+
+    def __get__(self, obj, objtype=None):
+        return self.func.__get__(obj, objtype)
+
+
 def tool(func):
     """Decorator to mark a method as a tool."""
-    func.__is_tool = True
-    return func
+    return _Tool(func)
 
 
 class Toolset:
@@ -13,11 +26,13 @@ class Toolset:
     Base class for defining a set of tools to be registered with FastMCP.
     Handles automatic registration of methods decorated with @tool.
     """
-    def import_tools(self, mcp: FastMCP):
-        for name, method in inspect.getmembers(self, predicate=inspect.ismethod):
-            if getattr(method, "__is_tool", False):
-                mcp.add_tool(fn=method, name=name, description=method.__doc__)
-
-
-
+    _tool_names: list[str] = []
 
+    def import_tools(self, mcp: FastMCP):
+        names = dict.fromkeys(
+            name
+            for klass in reversed(type(self).__mro__)
+            for name in klass.__dict__.get("_tool_names", ())
+        )
+        for name in names:
+            mcp.add_tool(fn=getattr(self, name), name=name, description=getattr(type(self), name).__doc__)
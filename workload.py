@@ -1,5 +1,6 @@
 import asyncio
 import json
+import time
 from pathlib import Path
 from typing import List, Optional, Literal
 import jwt
@@ -7,10 +8,43 @@ from fastmcp.server.dependencies import get_http_request
 from bedrock_agentcore.services.identity import IdentityClient
 from bedrock_agentcore.identity.auth import  _get_region
 
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to stdlib json
+    orjson = None
+
+
+_CLAIMS_CACHE: dict[str, tuple] = {}
+_CLAIMS_CACHE_SIZE = 1024
+
+
+def _decode_claims(token: str) -> tuple:
+    """Decode a JWT once per raw token string and return its (sub, exp) claims."""
+    cached = _CLAIMS_CACHE.get(token)
+    if cached is not None:
+        if time.time() < cached[1]:
+            return cached
+        # Expired tokens are evicted and no longer cached
+        _CLAIMS_CACHE.pop(token, None)
+        return cached
+
+    claims = jwt.decode(token, options={"verify_signature": False})
+    exp = claims.get("exp")
+    entry = (claims.get("sub"), exp if isinstance(exp, (int, float)) else float("inf"))
+    if time.time() < entry[1]:
+        if len(_CLAIMS_CACHE) >= _CLAIMS_CACHE_SIZE:
+            # Dicts keep insertion order, drop the oldest entry
+            _CLAIMS_CACHE.pop(next(iter(_CLAIMS_CACHE)), None)
+        _CLAIMS_CACHE[token] = entry
+    return entry
+
+
 class Workload:
     def __init__(self, callback_url="https://api.tomasp.me/redirect"):
         self.client = IdentityClient(_get_region())
         self.callback_url = callback_url
+        self._identity_cache: dict[str, str] = {}
+        self._identity_locks: dict[str, asyncio.Lock] = {}
 
     def get_user(self) -> str | dict:
         """Extract user identity from the Authorization header in the HTTP request."""
@@ -29,11 +63,11 @@ class Workload:
         token = auth_header.split(" ", 1)[1]
 
         try:
-            claims = jwt.decode(token, options={"verify_signature": False})
+            sub, _ = _decode_claims(token)
         except Exception:
             return {"error": "Invalid token"}
 
-        return claims.get("sub")
+        return sub
 
     async def get_google_auth_url(self) -> dict:
         """
@@ -64,13 +98,18 @@ class Workload:
         """
         Get or create a workload identity for the given user ID.
         """
+        if user_id in self._identity_cache:
+            return self._identity_cache[user_id]
+
         path = Path(f".agentcore-{user_id}.json")
 
         if path.exists():
             try:
-                with open(path) as f:
-                    cfg = json.load(f)
-                    return cfg["workload_identity_name"]
+                with open(path, "rb") as f:
+                    raw = f.read()
+                cfg = orjson.loads(raw) if orjson else json.loads(raw)
+                self._identity_cache[user_id] = cfg["workload_identity_name"]
+                return self._identity_cache[user_id]
             except Exception:
                 pass
 
@@ -83,14 +122,29 @@ class Workload:
             allowed_resource_oauth_2_return_urls=[self.callback_url],
         )
 
-        with open(path, "w") as f:
+        cfg = {"workload_identity_name": identity_name}
+        with open(path, "wb") as f:
             # Caching the identity name
-            json.dump({"workload_identity_name": identity_name}, f, indent=2)
+            if orjson:
+                f.write(orjson.dumps(cfg, option=orjson.OPT_INDENT_2))
+            else:
+                f.write(json.dumps(cfg, indent=2).encode("utf-8"))
 
+        self._identity_cache[user_id] = identity_name
         return identity_name
 
     async def get_workload_access_token(self, user_id: str) -> str:
-        resp = self.client.get_workload_access_token(self.get_workload_identity(user_id), user_id=user_id)
+        identity_name = self._identity_cache.get(user_id)
+        if identity_name is None:
+            # Concurrent first calls for a user must not each create an identity
+            async with self._identity_locks.setdefault(user_id, asyncio.Lock()):
+                identity_name = self._identity_cache.get(user_id)
+                if identity_name is None:
+                    # First lookup for this user hits disk and possibly the identity API
+                    identity_name = await asyncio.to_thread(self.get_workload_identity, user_id)
+            self._identity_locks.pop(user_id, None)
+
+        resp = self.client.get_workload_access_token(identity_name, user_id=user_id)
 
         return resp["workloadAccessToken"]
 